@@ -3,7 +3,8 @@ Flask Backend API untuk Product Review Analyzer
 """
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-from models import db, Review
+from models import db, Review, serialize_reviews, get_pool_status
+from sqlalchemy import text
 from config import config
 import requests
 import google.generativeai as genai
@@ -20,6 +21,12 @@ def create_app(config_name='development'):
     app = Flask(__name__)
     app.config.from_object(config[config_name])
     
+    # Read replica sebagai bind terpisah (engine options ikut SQLALCHEMY_ENGINE_OPTIONS)
+    if app.config.get('DATABASE_REPLICA_URL'):
+        app.config['SQLALCHEMY_BINDS'] = {
+            'replica': app.config['DATABASE_REPLICA_URL']
+        }
+    
     # Initialize extensions
     CORS(app)  # Enable CORS untuk React frontend
     db.init_app(app)
@@ -384,18 +391,18 @@ def extract_key_points_gemini(text):
                 for i, point in enumerate(key_points_array, 1):
                     print(f"  {i}. {point}")
                 print("="*50 + "\n")
-                return json.dumps(key_points_array)
+                return key_points_array
             else:
                 print("⚠️ Response not a list, wrapping...")
-                return json.dumps([key_points_text])
+                return [key_points_text]
         except json.JSONDecodeError as e:
             print(f"⚠️ JSON parse error: {e}")
-            return json.dumps([key_points_text.strip()])
+            return [key_points_text.strip()]
             
     except Exception as e:
         print(f"❌ Gemini API error: {e}")
         print("="*50 + "\n")
-        return json.dumps([f"Error extracting key points: {str(e)}"])
+        return [f"Error extracting key points: {str(e)}"]
 
 
 # ===========================
@@ -459,7 +466,7 @@ def analyze_review():
         # KEY POINTS EXTRACTION (gunakan text ORIGINAL untuk Gemini)
         # Gemini bisa handle multiple languages
         # ============================================
-        key_points_json = extract_key_points_gemini(review_text)  # Pakai original text
+        key_points = extract_key_points_gemini(review_text)  # Pakai original text
         
         # Create new review object
         new_review = Review(
@@ -467,22 +474,16 @@ def analyze_review():
             review_text=review_text,  # Simpan original text
             sentiment=sentiment_result.get('sentiment', 'neutral'),
             sentiment_score=sentiment_result.get('score', 0.0),
-            key_points=key_points_json
+            key_points=key_points
         )
         
-        # Save to database
+        # Save to database (selalu ke primary)
         db.session.add(new_review)
         db.session.commit()
         
         # Prepare response
         review_dict = new_review.to_dict()
         
-        # Parse key_points dari JSON string ke array
-        try:
-            review_dict['key_points'] = json.loads(review_dict['key_points'])
-        except:
-            review_dict['key_points'] = []
-        
         # Add translation info to response (optional, for debugging)
         review_dict['meta'] = {
             'original_language': original_language,
@@ -525,28 +526,15 @@ def get_reviews():
         limit = request.args.get('limit', 50, type=int)
         sentiment_filter = request.args.get('sentiment', None)
         
-        # Query database
-        query = Review.query.order_by(Review.created_at.desc())
+        # Query database (column-level, tanpa ORM object)
+        query = Review.select_columns().order_by(Review.created_at.desc())
         
         # Apply sentiment filter if provided
         if sentiment_filter:
-            query = query.filter(Review.sentiment == sentiment_filter.lower())
+            query = query.where(Review.sentiment == sentiment_filter.lower())
         
-        # Apply limit
-        reviews = query.limit(limit).all()
-        
-        # Convert to dict
-        reviews_data = []
-        for review in reviews:
-            review_dict = review.to_dict()
-            
-            # Parse key_points dari JSON string ke array
-            try:
-                review_dict['key_points'] = json.loads(review_dict['key_points'])
-            except:
-                review_dict['key_points'] = []
-            
-            reviews_data.append(review_dict)
+        # Apply limit & convert to dict (dibaca dari replica kalau ada)
+        reviews_data = serialize_reviews(query.limit(limit))
         
         return jsonify({
             'success': True,
@@ -566,11 +554,40 @@ def get_reviews():
 def health_check():
     """
     Health check endpoint
+    Ping setiap engine (primary & replica) dengan SELECT 1
+    """
+    databases = {}
+    for name, engine in db.engines.items():
+        bind_name = name or 'primary'
+        try:
+            with engine.connect() as conn:
+                conn.execute(text('SELECT 1'))
+            databases[bind_name] = 'connected'
+        except Exception as e:
+            print(f"❌ Health check failed for {bind_name}: {e}")
+            databases[bind_name] = 'disconnected'
+    
+    healthy = all(status == 'connected' for status in databases.values())
+    
+    return jsonify({
+        'success': healthy,
+        'message': 'API is running' if healthy else 'Database unavailable',
+        'database': 'connected' if healthy else 'disconnected',
+        'databases': databases
+    }), 200 if healthy else 503
+
+
+@app.route('/api/metrics/pool', methods=['GET'])
+def pool_metrics():
+    """
+    Connection pool metrics untuk setiap engine
     """
     return jsonify({
         'success': True,
-        'message': 'API is running',
-        'database': 'connected' if db.engine else 'disconnected'
+        'data': {
+            name or 'primary': get_pool_status(engine)
+            for name, engine in db.engines.items()
+        }
     }), 200
 
 
@@ -8,12 +8,39 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def build_engine_options():
+    """
+    Build SQLALCHEMY_ENGINE_OPTIONS dari environment variables
+    Dipakai untuk semua engine (primary & replica)
+    """
+    options = {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 30)),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'True') == 'True',
+    }
+    
+    # Statement timeout (ms) di sisi PostgreSQL, 0 = tanpa limit
+    statement_timeout = int(os.getenv('DB_STATEMENT_TIMEOUT_MS', 0))
+    if statement_timeout > 0:
+        options['connect_args'] = {
+            'options': f'-c statement_timeout={statement_timeout}'
+        }
+    
+    return options
+
+
 class Config:
     """Base configuration"""
     
     # Database
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = build_engine_options()
+    
+    # Read replica (optional), GET endpoints pakai engine ini
+    DATABASE_REPLICA_URL = os.getenv('DATABASE_REPLICA_URL')
     
     # API Keys
     HUGGINGFACE_API_KEY = os.getenv('HUGGINGFACE_API_KEY')
@@ -0,0 +1,75 @@
+"""
+Migration: ubah kolom reviews.key_points dari TEXT ke JSONB
+
+Jalankan sekali untuk database yang sudah ada:
+    python migrate_key_points.py
+
+Row dengan key_points yang bukan JSON array valid akan diganti jadi []
+(sama dengan fallback parsing yang lama). Aman dijalankan ulang.
+"""
+import json
+from sqlalchemy import text
+from app import app
+from models import db
+
+
+def get_column_type():
+    """
+    Ambil tipe kolom key_points saat ini dari information_schema
+    """
+    return db.session.execute(text("""
+        SELECT data_type FROM information_schema.columns
+        WHERE table_name = 'reviews' AND column_name = 'key_points'
+    """)).scalar()
+
+
+def normalize_key_points():
+    """
+    Pastikan semua key_points berisi JSON array valid sebelum di-cast
+    """
+    rows = db.session.execute(text(
+        "SELECT id, key_points FROM reviews WHERE key_points IS NOT NULL"
+    )).all()
+
+    fixed = 0
+    for row in rows:
+        try:
+            is_valid = isinstance(json.loads(row.key_points), list)
+        except (TypeError, ValueError):
+            is_valid = False
+
+        if not is_valid:
+            db.session.execute(
+                text("UPDATE reviews SET key_points = '[]' WHERE id = :id"),
+                {'id': row.id}
+            )
+            fixed += 1
+
+    print(f"Normalized {fixed} of {len(rows)} rows")
+
+
+def migrate():
+    with app.app_context():
+        column_type = get_column_type()
+        print(f"Current key_points type: {column_type}")
+
+        if column_type == 'jsonb':
+            print("✅ key_points already JSONB, nothing to do")
+            return
+
+        try:
+            normalize_key_points()
+            db.session.execute(text("""
+                ALTER TABLE reviews
+                ALTER COLUMN key_points TYPE JSONB USING key_points::jsonb
+            """))
+            db.session.commit()
+            print("✅ key_points migrated to JSONB")
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Migration failed: {e}")
+            raise
+
+
+if __name__ == '__main__':
+    migrate()
@@ -2,6 +2,7 @@
 Database models untuk Product Review Analyzer
 """
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
 
 db = SQLAlchemy()
@@ -19,7 +20,9 @@ class Review(db.Model):
     review_text = db.Column(db.Text, nullable=False)
     sentiment = db.Column(db.String(20), nullable=True)  # positive/negative/neutral
     sentiment_score = db.Column(db.Float, nullable=True)  # confidence score
-    key_points = db.Column(db.Text, nullable=True)  # JSON string dari Gemini
+    key_points = db.Column(
+        db.JSON().with_variant(JSONB(), 'postgresql'), nullable=True
+    )  # JSON array dari Gemini (JSONB di PostgreSQL)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     def to_dict(self):
@@ -32,9 +35,82 @@ class Review(db.Model):
             'review_text': self.review_text,
             'sentiment': self.sentiment,
             'sentiment_score': self.sentiment_score,
-            'key_points': self.key_points,
+            'key_points': self.key_points or [],
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
     
+    @classmethod
+    def select_columns(cls):
+        """
+        Select statement untuk kolom-kolom yang dipakai di response
+        Mengambil row per kolom, bukan full ORM object
+        """
+        return db.select(
+            cls.id,
+            cls.product_name,
+            cls.review_text,
+            cls.sentiment,
+            cls.sentiment_score,
+            cls.key_points,
+            cls.created_at
+        )
+    
+    @staticmethod
+    def row_to_dict(row):
+        """
+        Convert row hasil column-level select ke dictionary
+        Sama dengan to_dict() tapi tanpa membuat ORM object
+        """
+        return {
+            'id': row.id,
+            'product_name': row.product_name,
+            'review_text': row.review_text,
+            'sentiment': row.sentiment,
+            'sentiment_score': row.sentiment_score,
+            'key_points': row.key_points or [],
+            'created_at': row.created_at.isoformat() if row.created_at else None
+        }
+    
     def __repr__(self):
-        return f""
\ No newline at end of file
+        return f""
+
+
+def get_read_engine():
+    """
+    Engine untuk query read-only
+    Pakai read replica kalau dikonfigurasi, kalau tidak fallback ke primary
+    """
+    return db.engines.get('replica', db.engine)
+
+
+def get_pool_status(engine):
+    """
+    Ambil metrics connection pool dari engine
+    
+    Returns:
+        dict: size, checked_in, checked_out, overflow (None kalau pool tidak support)
+    """
+    pool = engine.pool
+    metrics = {}
+    for key, method in [('size', 'size'), ('checked_in', 'checkedin'),
+                        ('checked_out', 'checkedout'), ('overflow', 'overflow')]:
+        metrics[key] = getattr(pool, method)() if hasattr(pool, method) else None
+    metrics['pool_class'] = type(pool).__name__
+    return metrics
+
+
+def serialize_reviews(statement):
+    """
+    Serialize list review untuk JSON response
+    
+    Args:
+        statement: select statement dari Review.select_columns()
+                   (dijalankan di read engine / replica)
+        
+    Returns:
+        list: list of dict, key_points sudah berupa array (tanpa json.loads)
+    """
+    rows = db.session.execute(
+        statement, bind_arguments={'bind': get_read_engine()}
+    ).all()
+    return [Review.row_to_dict(row) for row in rows]